@@ -2,21 +2,25 @@
 import json
 import multiprocessing as mp
 import os
+import re
 import signal
-from datetime import datetime, timezone
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from queue import Empty
 from typing import Mapping
 from uuid import uuid4
 
 import click
 
-from mineru.utils.config_reader import get_device
-from mineru.utils.guess_suffix_or_lang import guess_suffix_by_path
-from mineru.utils.model_utils import get_vram
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from mineru.utils.supported_suffixes import image_suffixes, pdf_suffixes
 
 from ..version import __version__
-from .common import do_parse, image_suffixes, pdf_suffixes, read_fn
 
 
 EXIT_CODES = {
@@ -37,6 +41,56 @@ ERROR_CODES = {
 }
 
 
+TERMINAL_EVENTS = {
+    "succeeded": ("job.succeeded", "completed", "Completed"),
+    "cancelled": ("job.cancelled", "cancelled", "Cancelled"),
+    "failed": ("job.failed", "failed", "Engine failed"),
+}
+
+BACKEND_CHOICES = (
+    "pipeline",
+    "vlm-http-client",
+    "hybrid-http-client",
+    "vlm-auto-engine",
+    "hybrid-auto-engine",
+)
+
+METHOD_CHOICES = ("auto", "txt", "ocr")
+
+LANG_CHOICES = (
+    "ch",
+    "ch_server",
+    "ch_lite",
+    "en",
+    "korean",
+    "japan",
+    "chinese_cht",
+    "ta",
+    "te",
+    "ka",
+    "th",
+    "el",
+    "latin",
+    "arabic",
+    "east_slavic",
+    "cyrillic",
+    "devanagari",
+)
+
+MODEL_SOURCE_CHOICES = ("huggingface", "modelscope", "local")
+
+_ALLOWED_SUFFIXES = frozenset(pdf_suffixes + image_suffixes)
+
+_IMAGE_ONLY_SCAN_BYTES = 64 * 1024
+
+
+# Group indexes map to _ARTIFACT_KEYS, so each name is classified in one match.
+_ARTIFACT_NAME_PATTERN = re.compile(
+    r"(\.md)\Z|(?:(_content_list)|(_middle)|(_model))\.json\Z"
+)
+_ARTIFACT_KEYS = (None, "markdown", "contentList", "middleJson", "modelJson")
+
+
 class EngineContractError(Exception):
     pass
 
@@ -53,12 +107,37 @@ class TimeoutExceededError(EngineContractError):
     pass
 
 
+_utc_second_cache = (None, "")
+
+
 def _utc_ts() -> str:
-    return (
-        datetime.now(timezone.utc)
-        .isoformat(timespec="milliseconds")
-        .replace("+00:00", "Z")
-    )
+    global _utc_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _utc_second_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _utc_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1_000_000:03d}Z"
+
+
+def _dumps(obj, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(
+        obj, ensure_ascii=False, indent=2 if indent else None
+    ).encode("utf-8")
+
+
+_pending_events: list[bytes] = []
+
+# Pre-encoded job.progress heartbeat; only used for job ids that need no
+# JSON escaping, anything else goes through _emit_event.
+_INPUT_VALIDATED_TEMPLATE = (
+    b'{"type":"job.progress","ts":"%b","jobId":"%b","stage":"running",'
+    b'"progress":10,"message":"Input validated","errorCode":null,'
+    b'"payload":{"documents":%d}}\n'
+)
+_TEMPLATE_SAFE_JOB_ID = re.compile(r"[A-Za-z0-9._:-]+")
 
 
 def _emit_event(
@@ -84,7 +163,37 @@ def _emit_event(
         "errorCode": error_code,
         "payload": payload if payload is not None else {},
     }
-    click.echo(json.dumps(event), err=False)
+    _pending_events.append(_dumps(event) + b"\n")
+
+
+def _emit_input_validated(enabled: bool, *, job_id: str, documents: int):
+    if not enabled:
+        return
+    if _TEMPLATE_SAFE_JOB_ID.fullmatch(job_id) is None:
+        _emit_event(
+            enabled,
+            event_type="job.progress",
+            job_id=job_id,
+            stage="running",
+            progress=10,
+            message="Input validated",
+            error_code=None,
+            payload={"documents": documents},
+        )
+        return
+    _pending_events.append(
+        _INPUT_VALIDATED_TEMPLATE
+        % (_utc_ts().encode("ascii"), job_id.encode("ascii"), documents)
+    )
+
+
+def _flush_events():
+    if not _pending_events:
+        return
+    stdout = sys.stdout.buffer
+    stdout.write(b"".join(_pending_events))
+    stdout.flush()
+    _pending_events.clear()
 
 
 def _collect_artifacts(output_dir: Path) -> dict[str, list[str]]:
@@ -97,16 +206,25 @@ def _collect_artifacts(output_dir: Path) -> dict[str, list[str]]:
     if not output_dir.exists() or not output_dir.is_dir():
         return artifacts
 
-    artifacts["markdown"] = sorted(str(path) for path in output_dir.rglob("*.md"))
-    artifacts["contentList"] = sorted(
-        str(path) for path in output_dir.rglob("*_content_list.json")
-    )
-    artifacts["middleJson"] = sorted(
-        str(path) for path in output_dir.rglob("*_middle.json")
-    )
-    artifacts["modelJson"] = sorted(
-        str(path) for path in output_dir.rglob("*_model.json")
-    )
+    pending_dirs = [str(output_dir)]
+    while pending_dirs:
+        try:
+            scanner = os.scandir(pending_dirs.pop())
+        except OSError:
+            continue
+        with scanner:
+            for entry in scanner:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith("."):
+                        pending_dirs.append(entry.path)
+                else:
+                    match = _ARTIFACT_NAME_PATTERN.search(name)
+                    if match is not None:
+                        artifacts[_ARTIFACT_KEYS[match.lastindex]].append(entry.path)
+
+    for paths in artifacts.values():
+        paths.sort()
     return artifacts
 
 
@@ -115,11 +233,15 @@ def _set_runtime_env(backend: str, device_mode, virtual_vram, model_source: str)
         return
 
     if os.getenv("MINERU_DEVICE_MODE") is None:
+        from mineru.utils.config_reader import get_device
+
         os.environ["MINERU_DEVICE_MODE"] = (
             device_mode if device_mode is not None else get_device()
         )
 
     if os.getenv("MINERU_VIRTUAL_VRAM_SIZE") is None:
+        from mineru.utils.model_utils import get_vram
+
         vram = (
             virtual_vram
             if virtual_vram is not None
@@ -131,20 +253,70 @@ def _set_runtime_env(backend: str, device_mode, virtual_vram, model_source: str)
         os.environ["MINERU_MODEL_SOURCE"] = model_source
 
 
-def _resolve_input_paths(input_path: Path) -> list[Path]:
+def _guess_suffix_by_path(path: str) -> str:
+    from mineru.utils.guess_suffix_or_lang import guess_suffix_by_path
+
+    return guess_suffix_by_path(path)
+
+
+def _resolve_input_paths(input_path: Path) -> list[tuple[Path, str]]:
     if not input_path.exists():
         raise InvalidInputError(f"Input does not exist: {input_path}")
 
     if input_path.is_dir():
         result = []
-        for path in input_path.glob("*"):
-            if guess_suffix_by_path(path) in pdf_suffixes + image_suffixes:
-                result.append(path)
+        with os.scandir(input_path) as scanner:
+            for entry in scanner:
+                if not entry.is_file():
+                    continue
+                stem, dot, suffix = entry.name.rpartition(".")
+                if not (stem and dot):
+                    stem, suffix = entry.name, ""
+                # Other extensions (tif, jpe, ...) and extensionless files
+                # are still accepted when their content is a supported type.
+                if (
+                    suffix.lower() in _ALLOWED_SUFFIXES
+                    or _guess_suffix_by_path(entry.path) in _ALLOWED_SUFFIXES
+                ):
+                    result.append((Path(entry.path), stem))
         if not result:
             raise InvalidInputError(f"No supported files found under: {input_path}")
         return result
 
-    return [input_path]
+    return [(input_path, input_path.stem)]
+
+
+def _looks_image_only(path: Path) -> bool:
+    # Heuristic: raster inputs and PDFs whose head and tail show image
+    # XObjects but no font resources. Compressed object streams hide the
+    # resource dictionaries, so such PDFs are never treated as image-only.
+    # Anything that is not clearly an image or a PDF is not image-only.
+    try:
+        suffix = path.suffix.lower().lstrip(".")
+        if suffix not in _ALLOWED_SUFFIXES:
+            suffix = _guess_suffix_by_path(str(path))
+        if suffix in image_suffixes:
+            return True
+        if suffix not in pdf_suffixes:
+            return False
+
+        with open(path, "rb") as input_file:
+            head = input_file.read(_IMAGE_ONLY_SCAN_BYTES)
+            input_file.seek(0, os.SEEK_END)
+            size = input_file.tell()
+            tail = b""
+            if size > _IMAGE_ONLY_SCAN_BYTES:
+                input_file.seek(
+                    max(size - _IMAGE_ONLY_SCAN_BYTES, _IMAGE_ONLY_SCAN_BYTES)
+                )
+                tail = input_file.read()
+    except OSError:
+        return False
+
+    for marker in (b"/Font", b"/ObjStm"):
+        if marker in head or marker in tail:
+            return False
+    return b"/Image" in head or b"/Image" in tail
 
 
 def _ensure_output_dir(output_dir: Path):
@@ -160,11 +332,16 @@ def _ensure_output_dir(output_dir: Path):
 
 
 def _write_result_manifest(output_dir: Path, manifest: Mapping[str, object]) -> bool:
+    manifest_path = os.path.join(str(output_dir), "result.json")
     try:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "result.json").write_text(
-            json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        try:
+            manifest_file = open(manifest_path, "wb")
+        except FileNotFoundError:
+            # Jobs rejected before _ensure_output_dir ran still get a manifest.
+            os.makedirs(str(output_dir), exist_ok=True)
+            manifest_file = open(manifest_path, "wb")
+        with manifest_file:
+            manifest_file.write(_dumps(manifest, indent=True))
         return True
     except Exception:
         return False
@@ -172,7 +349,7 @@ def _write_result_manifest(output_dir: Path, manifest: Mapping[str, object]) ->
 
 def _execute_parse(
     *,
-    input_paths: list[Path],
+    input_paths: list[tuple[Path, str]],
     output_dir: Path,
     backend: str,
     method: str,
@@ -185,28 +362,186 @@ def _execute_parse(
     virtual_vram,
     model_source: str,
     server_url,
+    workers: int = 1,
+    skip_unsupported: bool = False,
 ):
-    _set_runtime_env(backend, device_mode, virtual_vram, model_source)
-    file_name_list = [path.stem for path in input_paths]
-    pdf_bytes_list = [read_fn(path) for path in input_paths]
-    lang_list = [lang] * len(input_paths)
-    do_parse(
-        output_dir=str(output_dir),
-        pdf_file_names=file_name_list,
-        pdf_bytes_list=pdf_bytes_list,
-        p_lang_list=lang_list,
-        backend=backend,
-        parse_method=method,
-        formula_enable=formula_enable,
-        table_enable=table_enable,
-        server_url=server_url,
-        start_page_id=start_page_id,
-        end_page_id=end_page_id,
-    )
+    runtime_env = (backend, device_mode, virtual_vram, model_source)
+    _set_runtime_env(*runtime_env)
+    parse_options = {
+        "output_dir": output_dir,
+        "backend": backend,
+        "method": method,
+        "lang": lang,
+        "start_page_id": start_page_id,
+        "end_page_id": end_page_id,
+        "formula_enable": formula_enable,
+        "table_enable": table_enable,
+        "server_url": server_url,
+        "skip_unsupported": skip_unsupported,
+    }
+    if (
+        workers > 1
+        and backend == "pipeline"
+        and len(input_paths) > 1
+        and os.environ["MINERU_DEVICE_MODE"] == "cpu"
+    ):
+        # Every worker loads its own pipeline models, so splitting is limited
+        # to CPU runs; on an accelerator the copies would over-commit memory.
+        # vlm/hybrid backends already batch on the inference engine.
+        processes = min(workers, len(input_paths))
+        executor = _get_parse_executor(processes)
+        futures = [
+            executor.submit(
+                _execute_parse_chunk,
+                input_paths[index::processes],
+                runtime_env,
+                parse_options,
+            )
+            for index in range(processes)
+        ]
+        try:
+            # A worker that dies abruptly (e.g. OOM kill) surfaces here as
+            # BrokenProcessPool instead of blocking forever.
+            parsed = sum(future.result() for future in futures)
+        except BaseException:
+            _discard_parse_executor()
+            raise
+    else:
+        parsed = _parse_documents(input_paths, **parse_options)
+
+    if not parsed:
+        raise InvalidInputError("No supported files found")
+
+
+def _parse_documents(
+    input_paths: list[tuple[Path, str]],
+    *,
+    output_dir: Path,
+    backend: str,
+    method: str,
+    lang: str,
+    start_page_id: int,
+    end_page_id,
+    formula_enable: bool,
+    table_enable: bool,
+    server_url,
+    skip_unsupported: bool,
+) -> int:
+    if backend == "pipeline" or len(input_paths) == 1:
+        batches = [input_paths]
+    else:
+        # vlm/hybrid backends parse documents one by one, so only keep the
+        # bytes of the document being parsed in memory.
+        batches = ([item] for item in input_paths)
+
+    from .common import do_parse, read_fn
+
+    output_dir_str = str(output_dir)
+    parsed = 0
+    for batch in batches:
+        pdf_file_names = []
+        pdf_bytes_list = []
+        for path, stem in batch:
+            try:
+                pdf_bytes = read_fn(path)
+            except Exception:
+                # Directory entries with a listed extension are not content
+                # sniffed, so a misnamed file is only caught here; skip it
+                # and keep parsing the rest of the directory.
+                if not skip_unsupported:
+                    raise
+                continue
+            pdf_file_names.append(stem)
+            pdf_bytes_list.append(pdf_bytes)
+        if not pdf_file_names:
+            continue
+        do_parse(
+            output_dir=output_dir_str,
+            pdf_file_names=pdf_file_names,
+            pdf_bytes_list=pdf_bytes_list,
+            p_lang_list=[lang] * len(pdf_file_names),
+            backend=backend,
+            parse_method=method,
+            formula_enable=formula_enable,
+            table_enable=table_enable,
+            server_url=server_url,
+            start_page_id=start_page_id,
+            end_page_id=end_page_id,
+        )
+        parsed += len(pdf_file_names)
+    return parsed
+
+
+_mp_context = None
+
+
+def _get_mp_context():
+    global _mp_context
+    if _mp_context is None:
+        if sys.platform == "win32":
+            _mp_context = mp.get_context("spawn")
+        else:
+            # The forkserver imports the parsing stack once and forks every
+            # worker from it, so repeated jobs skip the spawn re-import.
+            _mp_context = mp.get_context("forkserver")
+            _mp_context.set_forkserver_preload(["mineru.cli.common"])
+    return _mp_context
+
+
+_parse_executor = None
+_parse_executor_size = 0
+
+
+def _get_parse_executor(processes: int):
+    global _parse_executor, _parse_executor_size
+    if _parse_executor is not None and _parse_executor_size != processes:
+        _discard_parse_executor()
+    if _parse_executor is None:
+        # Forked pool workers would otherwise inherit _exit_on_sigterm from
+        # the timed worker and ignore terminate().
+        _parse_executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=_get_mp_context(),
+            initializer=signal.signal,
+            initargs=(signal.SIGTERM, signal.SIG_DFL),
+        )
+        _parse_executor_size = processes
+    return _parse_executor
+
+
+def _shutdown_parse_executor():
+    global _parse_executor
+    executor, _parse_executor = _parse_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _discard_parse_executor():
+    global _parse_executor
+    executor, _parse_executor = _parse_executor, None
+    if executor is None:
+        return
+    # shutdown() would wait for running chunks, so stop this pool's own
+    # workers first; other children of the process are left alone.
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _execute_parse_chunk(
+    input_paths: list[tuple[Path, str]], runtime_env: tuple, parse_options: dict
+) -> int:
+    _set_runtime_env(*runtime_env)
+    return _parse_documents(input_paths, **parse_options)
+
+
+def _exit_on_sigterm(_signum, _frame):
+    _discard_parse_executor()
+    raise SystemExit(1)
 
 
 def _parse_worker(
-    input_paths: list[Path],
+    input_paths: list[tuple[Path, str]],
     output_dir: Path,
     backend: str,
     method: str,
@@ -219,8 +554,19 @@ def _parse_worker(
     virtual_vram,
     model_source: str,
     server_url,
-    result_queue,
+    workers,
+    skip_unsupported,
+    result_conn,
 ):
+    global _mp_context
+    if workers > 1 and sys.platform != "win32":
+        # This process was already forked with the parsing stack imported, so
+        # fork the pool workers from it rather than starting a nested
+        # forkserver that would import the stack a second time.
+        _mp_context = mp.get_context("fork")
+        # Exit through Python on terminate() so the parse executor is torn
+        # down instead of being orphaned.
+        signal.signal(signal.SIGTERM, _exit_on_sigterm)
     try:
         _execute_parse(
             input_paths=input_paths,
@@ -236,10 +582,38 @@ def _parse_worker(
             virtual_vram=virtual_vram,
             model_source=model_source,
             server_url=server_url,
+            workers=workers,
+            skip_unsupported=skip_unsupported,
         )
-        result_queue.put({"ok": True})
+        result_conn.send({"ok": True})
+    except InvalidInputError:
+        result_conn.send({"ok": False, "errorCode": ERROR_CODES["invalid_input"]})
     except Exception:
-        result_queue.put({"ok": False, "errorCode": ERROR_CODES["engine_failed"]})
+        result_conn.send({"ok": False, "errorCode": ERROR_CODES["engine_failed"]})
+    finally:
+        # Idle pool workers would keep this process alive past the parent's
+        # join() and turn a finished job into a timeout.
+        _shutdown_parse_executor()
+        result_conn.close()
+
+
+_sigterm_handler_installed = False
+
+
+def _handle_sigterm(_signum, _frame):
+    raise KeyboardInterrupt
+
+
+def _install_sigterm_handler():
+    global _sigterm_handler_installed
+    if _sigterm_handler_installed or sys.platform == "win32":
+        return
+    try:
+        signal.signal(signal.SIGTERM, _handle_sigterm)
+    except ValueError:
+        # signal.signal only works from the main thread
+        return
+    _sigterm_handler_installed = True
 
 
 def _run_engine(
@@ -259,158 +633,169 @@ def _run_engine(
     model_source: str,
     timeout_ms,
     server_url,
+    workers: int,
+    index_artifacts: bool,
+    prescan_image_only: bool,
     jsonl: bool,
 ) -> int:
-    start_time = datetime.now(timezone.utc)
+    job_id = job_id or uuid4().hex
+    started_at = _utc_ts()
+    start_ns = time.monotonic_ns()
     input_path_obj = Path(input_path).expanduser().resolve()
     output_dir_path = Path(output_dir).expanduser().resolve()
     status = "failed"
     error_code = ERROR_CODES["engine_failed"]
     exit_code = EXIT_CODES["failed"]
-    previous_sigterm_handler = None
-
-    def _handle_sigterm(_signum, _frame):
-        raise KeyboardInterrupt
 
-    if hasattr(signal, "SIGTERM"):
-        try:
-            previous_sigterm_handler = signal.getsignal(signal.SIGTERM)
-            signal.signal(signal.SIGTERM, _handle_sigterm)
-        except (AttributeError, OSError, ValueError):
-            previous_sigterm_handler = None
-
-    _emit_event(
-        jsonl,
-        event_type="job.started",
-        job_id=job_id,
-        stage="starting",
-        progress=0,
-        message="Engine process started",
-        error_code=None,
-        payload={"backend": backend, "method": method},
-    )
+    if jsonl:
+        _emit_event(
+            jsonl,
+            event_type="job.started",
+            job_id=job_id,
+            stage="starting",
+            progress=0,
+            message="Engine process started",
+            error_code=None,
+            payload={"backend": backend, "method": method},
+        )
 
     try:
-        try:
-            if timeout_ms is not None and timeout_ms <= 0:
-                raise InvalidInputError("timeoutMs must be greater than zero")
-            if end_page_id is not None and start_page_id > end_page_id:
-                raise InvalidInputError("start must be less than or equal to end")
-
-            input_paths = _resolve_input_paths(input_path_obj)
-            _ensure_output_dir(output_dir_path)
-
-            _emit_event(
-                jsonl,
-                event_type="job.progress",
-                job_id=job_id,
-                stage="running",
-                progress=10,
-                message="Input validated",
-                error_code=None,
-                payload={"documents": len(input_paths)},
-            )
-
-            if timeout_ms is None:
-                _execute_parse(
-                    input_paths=input_paths,
-                    output_dir=output_dir_path,
-                    backend=backend,
-                    method=method,
-                    lang=lang,
-                    start_page_id=start_page_id,
-                    end_page_id=end_page_id,
-                    formula_enable=formula_enable,
-                    table_enable=table_enable,
-                    device_mode=device_mode,
-                    virtual_vram=virtual_vram,
-                    model_source=model_source,
-                    server_url=server_url,
+        if timeout_ms is not None and timeout_ms <= 0:
+            raise InvalidInputError("timeoutMs must be greater than zero")
+        if workers < 1:
+            raise InvalidInputError("workers must be at least one")
+        if end_page_id is not None and start_page_id > end_page_id:
+            raise InvalidInputError("start must be less than or equal to end")
+
+        input_paths = _resolve_input_paths(input_path_obj)
+        skip_unsupported = input_path_obj.is_dir()
+        _ensure_output_dir(output_dir_path)
+
+        _emit_input_validated(jsonl, job_id=job_id, documents=len(input_paths))
+        if (
+            prescan_image_only
+            and method == "auto"
+            and not backend.startswith("vlm-")
+            and all(_looks_image_only(path) for path, _ in input_paths)
+        ):
+            method = "ocr"
+            if jsonl:
+                _emit_event(
+                    jsonl,
+                    event_type="job.progress",
+                    job_id=job_id,
+                    stage="running",
+                    progress=10,
+                    message="Image-only input detected, using ocr",
+                    error_code=None,
+                    payload={"method": method},
                 )
-            else:
-                ctx = mp.get_context("spawn")
-                result_queue = ctx.Queue()
-                worker = ctx.Process(
-                    target=_parse_worker,
-                    args=(
-                        input_paths,
-                        output_dir_path,
-                        backend,
-                        method,
-                        lang,
-                        start_page_id,
-                        end_page_id,
-                        formula_enable,
-                        table_enable,
-                        device_mode,
-                        virtual_vram,
-                        model_source,
-                        server_url,
-                        result_queue,
-                    ),
-                )
-                worker.start()
-                try:
-                    worker.join(timeout_ms / 1000.0)
-                    if worker.is_alive():
-                        worker.terminate()
-                        worker.join()
-                        raise TimeoutExceededError("Timed out")
-
-                    worker_result = {
-                        "ok": False,
-                        "errorCode": ERROR_CODES["engine_failed"],
-                    }
-                    try:
-                        worker_result = result_queue.get_nowait()
-                    except Empty:
-                        pass
-
-                    if not worker_result.get("ok"):
-                        raise EngineContractError(
-                            worker_result.get("errorCode", ERROR_CODES["engine_failed"])
-                        )
-                finally:
-                    if worker.is_alive():
-                        worker.terminate()
-                        worker.join()
-                    result_queue.close()
-                    result_queue.join_thread()
-
-            status = "succeeded"
-            error_code = None
-            exit_code = EXIT_CODES["succeeded"]
-        except InvalidInputError:
-            status = "failed"
-            error_code = ERROR_CODES["invalid_input"]
-            exit_code = EXIT_CODES["invalid_input"]
-        except OutputUnwritableError:
-            status = "failed"
-            error_code = ERROR_CODES["output_unwritable"]
-            exit_code = EXIT_CODES["output_unwritable"]
-        except KeyboardInterrupt:
-            status = "cancelled"
-            error_code = ERROR_CODES["cancelled"]
-            exit_code = EXIT_CODES["cancelled"]
-        except TimeoutExceededError:
-            status = "timeout"
-            error_code = ERROR_CODES["timeout"]
-            exit_code = EXIT_CODES["timeout"]
-        except Exception:
-            status = "failed"
-            error_code = ERROR_CODES["engine_failed"]
-            exit_code = EXIT_CODES["failed"]
-    finally:
-        if hasattr(signal, "SIGTERM") and previous_sigterm_handler is not None:
+        _flush_events()
+
+        if timeout_ms is None:
+            _execute_parse(
+                input_paths=input_paths,
+                output_dir=output_dir_path,
+                backend=backend,
+                method=method,
+                lang=lang,
+                start_page_id=start_page_id,
+                end_page_id=end_page_id,
+                formula_enable=formula_enable,
+                table_enable=table_enable,
+                device_mode=device_mode,
+                virtual_vram=virtual_vram,
+                model_source=model_source,
+                server_url=server_url,
+                workers=workers,
+                skip_unsupported=skip_unsupported,
+            )
+        else:
+            ctx = _get_mp_context()
+            # Only paths cross the process boundary; the worker reads the
+            # inputs itself so document bytes are never pickled.
+            result_conn, worker_conn = ctx.Pipe(duplex=False)
+            worker = ctx.Process(
+                target=_parse_worker,
+                args=(
+                    input_paths,
+                    output_dir_path,
+                    backend,
+                    method,
+                    lang,
+                    start_page_id,
+                    end_page_id,
+                    formula_enable,
+                    table_enable,
+                    device_mode,
+                    virtual_vram,
+                    model_source,
+                    server_url,
+                    workers,
+                    skip_unsupported,
+                    worker_conn,
+                ),
+            )
+            worker.start()
+            worker_conn.close()
             try:
-                signal.signal(signal.SIGTERM, previous_sigterm_handler)
-            except (AttributeError, OSError, ValueError):
-                pass
+                worker.join(timeout_ms / 1000.0)
+                if worker.is_alive():
+                    worker.terminate()
+                    worker.join()
+                    raise TimeoutExceededError("Timed out")
+
+                worker_result = {
+                    "ok": False,
+                    "errorCode": ERROR_CODES["engine_failed"],
+                }
+                try:
+                    if result_conn.poll():
+                        worker_result = result_conn.recv()
+                except EOFError:
+                    pass
+
+                if worker_result.get("errorCode") == ERROR_CODES["invalid_input"]:
+                    raise InvalidInputError("No supported files found")
+                if not worker_result.get("ok"):
+                    raise EngineContractError(
+                        worker_result.get("errorCode", ERROR_CODES["engine_failed"])
+                    )
+            finally:
+                if worker.is_alive():
+                    worker.terminate()
+                    worker.join()
+                result_conn.close()
+
+        status = "succeeded"
+        error_code = None
+        exit_code = EXIT_CODES["succeeded"]
+    except InvalidInputError:
+        status = "failed"
+        error_code = ERROR_CODES["invalid_input"]
+        exit_code = EXIT_CODES["invalid_input"]
+    except OutputUnwritableError:
+        status = "failed"
+        error_code = ERROR_CODES["output_unwritable"]
+        exit_code = EXIT_CODES["output_unwritable"]
+    except KeyboardInterrupt:
+        status = "cancelled"
+        error_code = ERROR_CODES["cancelled"]
+        exit_code = EXIT_CODES["cancelled"]
+    except TimeoutExceededError:
+        status = "timeout"
+        error_code = ERROR_CODES["timeout"]
+        exit_code = EXIT_CODES["timeout"]
+    except Exception:
+        status = "failed"
+        error_code = ERROR_CODES["engine_failed"]
+        exit_code = EXIT_CODES["failed"]
 
-    end_time = datetime.now(timezone.utc)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+    ended_at = _utc_ts()
     artifacts = (
         _collect_artifacts(output_dir_path)
-        if status == "succeeded"
+        if status == "succeeded" and index_artifacts
         else {"markdown": [], "contentList": [], "middleJson": [], "modelJson": []}
     )
     manifest = {
@@ -422,15 +807,13 @@ def _run_engine(
         "backend": backend,
         "method": method,
         "timings": {
-            "startedAt": start_time.isoformat(timespec="milliseconds").replace(
-                "+00:00", "Z"
-            ),
-            "endedAt": end_time.isoformat(timespec="milliseconds").replace(
-                "+00:00", "Z"
-            ),
-            "durationMs": int((end_time - start_time).total_seconds() * 1000),
+            "startedAt": started_at,
+            "endedAt": ended_at,
+            "durationMs": duration_ms,
         },
     }
+    if not index_artifacts:
+        manifest["artifactsIndexed"] = False
 
     manifest_written = _write_result_manifest(output_dir_path, manifest)
     if not manifest_written:
@@ -438,42 +821,22 @@ def _run_engine(
         error_code = ERROR_CODES["output_unwritable"]
         exit_code = EXIT_CODES["output_unwritable"]
 
-    result_payload = {
-        "resultPath": str(output_dir_path / "result.json") if manifest_written else None
-    }
-    if status == "succeeded":
-        _emit_event(
-            jsonl,
-            event_type="job.succeeded",
-            job_id=job_id,
-            stage="completed",
-            progress=100,
-            message="Completed",
-            error_code=None,
-            payload=result_payload,
-        )
-    elif status == "cancelled":
-        _emit_event(
-            jsonl,
-            event_type="job.cancelled",
-            job_id=job_id,
-            stage="cancelled",
-            progress=100,
-            message="Cancelled",
-            error_code=error_code,
-            payload=result_payload,
+    if jsonl:
+        event_type, stage, message = TERMINAL_EVENTS.get(
+            status, TERMINAL_EVENTS["failed"]
         )
-    else:
+        result_path = str(output_dir_path / "result.json") if manifest_written else None
         _emit_event(
             jsonl,
-            event_type="job.failed",
+            event_type=event_type,
             job_id=job_id,
-            stage="failed",
+            stage=stage,
             progress=100,
-            message="Engine failed",
+            message=message,
             error_code=error_code,
-            payload=result_payload,
+            payload={"resultPath": result_path},
         )
+    _flush_events()
 
     return exit_code
 
@@ -492,54 +855,26 @@ def _run_engine(
 @click.option(
     "--job-id",
     type=str,
-    default=lambda: str(uuid4()),
+    default=None,
     show_default=False,
-    help="Job identifier",
+    help="Job identifier (generated when omitted)",
 )
 @click.option(
     "--backend",
-    type=click.Choice(
-        [
-            "pipeline",
-            "vlm-http-client",
-            "hybrid-http-client",
-            "vlm-auto-engine",
-            "hybrid-auto-engine",
-        ]
-    ),
+    type=click.Choice(BACKEND_CHOICES),
     default="pipeline",
     show_default=True,
     help="Parsing backend",
 )
 @click.option(
     "--method",
-    type=click.Choice(["auto", "txt", "ocr"]),
+    type=click.Choice(METHOD_CHOICES),
     default="auto",
     show_default=True,
 )
 @click.option(
     "--lang",
-    type=click.Choice(
-        [
-            "ch",
-            "ch_server",
-            "ch_lite",
-            "en",
-            "korean",
-            "japan",
-            "chinese_cht",
-            "ta",
-            "te",
-            "ka",
-            "th",
-            "el",
-            "latin",
-            "arabic",
-            "east_slavic",
-            "cyrillic",
-            "devanagari",
-        ]
-    ),
+    type=click.Choice(LANG_CHOICES),
     default="ch",
     show_default=True,
 )
@@ -559,7 +894,7 @@ def _run_engine(
 @click.option(
     "--source",
     "model_source",
-    type=click.Choice(["huggingface", "modelscope", "local"]),
+    type=click.Choice(MODEL_SOURCE_CHOICES),
     default="huggingface",
     show_default=True,
 )
@@ -571,6 +906,28 @@ def _run_engine(
     help="Server URL for http-client backends",
 )
 @click.option("--timeout-ms", type=int, default=None, help="Timeout in milliseconds")
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes for multi-document pipeline jobs on CPU",
+)
+@click.option(
+    "--index-artifacts/--no-index-artifacts",
+    default=True,
+    show_default=True,
+    help="List produced artifacts in result.json",
+)
+@click.option(
+    "--prescan-image-only/--no-prescan-image-only",
+    default=False,
+    show_default=True,
+    help=(
+        "Switch auto jobs whose inputs all look image-only to ocr; "
+        "output is then written under <name>/ocr instead of <name>/auto"
+    ),
+)
 @click.option(
     "--jsonl/--no-jsonl",
     default=True,
@@ -578,6 +935,7 @@ def _run_engine(
     help="Enable JSONL progress events",
 )
 def main(**kwargs):
+    _install_sigterm_handler()
     raise SystemExit(_run_engine(**kwargs))
 
 
@@ -0,0 +1,3 @@
+# Copyright (c) Opendatalab. All rights reserved.
+pdf_suffixes = ["pdf"]
+image_suffixes = ["png", "jpeg", "jp2", "webp", "gif", "bmp", "jpg", "tiff"]
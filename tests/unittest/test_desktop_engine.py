@@ -0,0 +1,557 @@
+# Copyright (c) Opendatalab. All rights reserved.
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+import types
+
+import pytest
+
+from mineru.cli import desktop_engine
+from mineru.cli.desktop_engine import (
+    _IMAGE_ONLY_SCAN_BYTES,
+    InvalidInputError,
+    _collect_artifacts,
+    _emit_event,
+    _emit_input_validated,
+    _looks_image_only,
+    _resolve_input_paths,
+    _run_engine,
+    _write_result_manifest,
+)
+
+
+def _write(path, data):
+    path.write_bytes(data)
+    return path
+
+
+def test_looks_image_only_scanned_pdf(tmp_path):
+    pdf_path = _write(
+        tmp_path / "scan.pdf",
+        b"%PDF-1.4\n1 0 obj << /Type /XObject /Subtype /Image >> endobj\n",
+    )
+    assert _looks_image_only(pdf_path)
+
+
+def test_looks_image_only_header_offset(tmp_path):
+    # Leading bytes before %PDF must not turn a text PDF into a raster image.
+    pdf_path = _write(
+        tmp_path / "bom.pdf",
+        b"\xef\xbb\xbf%PDF-1.4\n1 0 obj << /Font << /F1 2 0 R >> >> endobj\n",
+    )
+    assert not _looks_image_only(pdf_path)
+
+
+def test_looks_image_only_object_streams(tmp_path):
+    pdf_path = _write(
+        tmp_path / "objstm.pdf",
+        b"%PDF-1.7\n1 0 obj << /Type /ObjStm >> endobj\n/Subtype /Image\n",
+    )
+    assert not _looks_image_only(pdf_path)
+
+
+def test_looks_image_only_font_in_tail(tmp_path):
+    pdf_path = _write(
+        tmp_path / "tail_font.pdf",
+        b"%PDF-1.4\n/Subtype /Image\n"
+        + b"0" * (_IMAGE_ONLY_SCAN_BYTES * 2)
+        + b"\n/Font << /F1 2 0 R >>\n%%EOF\n",
+    )
+    assert not _looks_image_only(pdf_path)
+
+
+def test_looks_image_only_by_suffix(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        desktop_engine,
+        "_guess_suffix_by_path",
+        lambda path: "tiff" if path.endswith(".tif") else "txt",
+    )
+    assert _looks_image_only(_write(tmp_path / "photo.png", b"\x89PNG\r\n"))
+    assert _looks_image_only(_write(tmp_path / "scan.tif", b"II*\x00"))
+    assert not _looks_image_only(_write(tmp_path / "notes.txt", b"hello"))
+    assert not _looks_image_only(tmp_path / "missing.pdf")
+
+
+def _take_events(monkeypatch, emit):
+    pending = []
+    monkeypatch.setattr(desktop_engine, "_pending_events", pending)
+    emit()
+    return pending
+
+
+@pytest.mark.parametrize("job_id", ["0123abcd", "job-1.a:b_c", 'quote"id', "任务"])
+def test_input_validated_template_matches_emit_event(monkeypatch, job_id):
+    monkeypatch.setattr(desktop_engine, "_utc_ts", lambda: "2026-01-01T00:00:00.000Z")
+    template_events = _take_events(
+        monkeypatch,
+        lambda: _emit_input_validated(True, job_id=job_id, documents=3),
+    )
+    generic_events = _take_events(
+        monkeypatch,
+        lambda: _emit_event(
+            True,
+            event_type="job.progress",
+            job_id=job_id,
+            stage="running",
+            progress=10,
+            message="Input validated",
+            error_code=None,
+            payload={"documents": 3},
+        ),
+    )
+    assert len(template_events) == len(generic_events) == 1
+    assert template_events[0].endswith(b"\n")
+    template_event = json.loads(template_events[0])
+    generic_event = json.loads(generic_events[0])
+    assert list(template_event.items()) == list(generic_event.items())
+    if desktop_engine.orjson is not None:
+        assert template_events == generic_events
+
+
+def test_input_validated_disabled(monkeypatch):
+    events = _take_events(
+        monkeypatch,
+        lambda: _emit_input_validated(False, job_id="job", documents=1),
+    )
+    assert events == []
+
+
+def test_collect_artifacts_skips_hidden_dirs(tmp_path):
+    hidden_dir = tmp_path / ".cache" / "auto"
+    hidden_dir.mkdir(parents=True)
+    (hidden_dir / "doc.md").write_text("x", encoding="utf-8")
+    (tmp_path / ".visible.md").write_text("x", encoding="utf-8")
+
+    artifacts = _collect_artifacts(tmp_path)
+    assert artifacts["markdown"] == [str(tmp_path / ".visible.md")]
+
+
+def test_collect_artifacts_missing_dir(tmp_path):
+    artifacts = _collect_artifacts(tmp_path / "missing")
+    assert artifacts == {
+        "markdown": [],
+        "contentList": [],
+        "middleJson": [],
+        "modelJson": [],
+    }
+
+
+def test_collect_artifacts_buckets(tmp_path):
+    doc_dir = tmp_path / "doc" / "auto"
+    doc_dir.mkdir(parents=True)
+    for name in [
+        "doc.md",
+        "doc_content_list.json",
+        "doc_content_list_v2.json",
+        "doc_middle.json",
+        "doc_model.json",
+        "doc_origin.pdf",
+        "doc.json",
+        "doc.mdx",
+    ]:
+        (doc_dir / name).write_text("x", encoding="utf-8")
+    (tmp_path / "other.md").write_text("x", encoding="utf-8")
+
+    artifacts = _collect_artifacts(tmp_path)
+    assert list(artifacts) == ["markdown", "contentList", "middleJson", "modelJson"]
+    assert artifacts["markdown"] == sorted(
+        [str(doc_dir / "doc.md"), str(tmp_path / "other.md")]
+    )
+    assert artifacts["contentList"] == [str(doc_dir / "doc_content_list.json")]
+    assert artifacts["middleJson"] == [str(doc_dir / "doc_middle.json")]
+    assert artifacts["modelJson"] == [str(doc_dir / "doc_model.json")]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="newline in file name")
+def test_collect_artifacts_rejects_trailing_newline(tmp_path):
+    for name in ["doc.md\n", "doc_model.json\n"]:
+        (tmp_path / name).write_text("x", encoding="utf-8")
+
+    artifacts = _collect_artifacts(tmp_path)
+    assert artifacts["markdown"] == []
+    assert artifacts["modelJson"] == []
+
+
+def test_resolve_input_paths_stems(tmp_path):
+    for name in ["a.pdf", "c.d.png", "report.v2.PDF"]:
+        (tmp_path / name).write_bytes(b"x")
+
+    resolved = _resolve_input_paths(tmp_path)
+    assert sorted((path.name, stem) for path, stem in resolved) == [
+        ("a.pdf", "a"),
+        ("c.d.png", "c.d"),
+        ("report.v2.PDF", "report.v2"),
+    ]
+    for path, _ in resolved:
+        assert path.parent == tmp_path
+
+
+def test_resolve_input_paths_single_file(tmp_path):
+    pdf_path = tmp_path / "doc.v2.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    assert _resolve_input_paths(pdf_path) == [(pdf_path, "doc.v2")]
+
+
+def _fake_do_parse(*, output_dir, pdf_file_names, pdf_bytes_list, parse_method, **_):
+    for name in pdf_file_names:
+        md_dir = os.path.join(output_dir, name, parse_method)
+        os.makedirs(md_dir, exist_ok=True)
+        with open(os.path.join(md_dir, f"{name}.md"), "w", encoding="utf-8") as md:
+            md.write(str(os.getpid()))
+
+
+def _slow_do_parse(**_):
+    time.sleep(30)
+
+
+def _fake_read_fn(path):
+    with open(path, "rb") as input_file:
+        file_bytes = input_file.read()
+    if not file_bytes.startswith(b"%PDF"):
+        raise Exception(f"Unknown file suffix: {path}")
+    return file_bytes
+
+
+@pytest.fixture
+def fake_engine(monkeypatch):
+    if sys.platform != "win32":
+        # Fork workers from the test process so they see the stubbed parser.
+        monkeypatch.setattr(desktop_engine, "_mp_context", mp.get_context("fork"))
+    monkeypatch.setattr(desktop_engine, "_parse_executor", None)
+    monkeypatch.setitem(
+        sys.modules,
+        "mineru.cli.common",
+        types.SimpleNamespace(do_parse=_fake_do_parse, read_fn=_fake_read_fn),
+    )
+    monkeypatch.setenv("MINERU_DEVICE_MODE", "cpu")
+    monkeypatch.setenv("MINERU_VIRTUAL_VRAM_SIZE", "1")
+    monkeypatch.setenv("MINERU_MODEL_SOURCE", "local")
+
+
+def _run(input_path, output_dir, **options):
+    kwargs = {
+        "input_path": str(input_path),
+        "output_dir": str(output_dir),
+        "job_id": "job",
+        "backend": "pipeline",
+        "method": "auto",
+        "lang": "ch",
+        "start_page_id": 0,
+        "end_page_id": None,
+        "formula_enable": True,
+        "table_enable": True,
+        "device_mode": None,
+        "virtual_vram": None,
+        "model_source": "local",
+        "timeout_ms": None,
+        "server_url": None,
+        "workers": 1,
+        "index_artifacts": True,
+        "prescan_image_only": False,
+        "jsonl": False,
+    }
+    kwargs.update(options)
+    return _run_engine(**kwargs)
+
+
+def _read_manifest(output_dir):
+    with open(output_dir / "result.json", encoding="utf-8") as manifest:
+        return json.load(manifest)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_run_engine_workers_with_timeout(tmp_path, fake_engine):
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    for index in range(4):
+        (input_dir / f"doc{index}.pdf").write_bytes(b"%PDF-1.4")
+    output_dir = tmp_path / "out"
+
+    assert _run(input_dir, output_dir, workers=2, timeout_ms=10000) == 0
+    manifest = _read_manifest(output_dir)
+    assert manifest["status"] == "succeeded"
+    assert len(manifest["artifacts"]["markdown"]) == 4
+    pids = set()
+    for md_path in manifest["artifacts"]["markdown"]:
+        with open(md_path, encoding="utf-8") as md:
+            pids.add(int(md.read()))
+    assert os.getpid() not in pids
+    assert mp.active_children() == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_run_engine_workers_timeout_stops_pool(tmp_path, fake_engine, monkeypatch):
+    monkeypatch.setattr(sys.modules["mineru.cli.common"], "do_parse", _slow_do_parse)
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    for index in range(4):
+        (input_dir / f"doc{index}.pdf").write_bytes(b"%PDF-1.4")
+
+    started = time.monotonic()
+    assert _run(input_dir, tmp_path / "out", workers=2, timeout_ms=1000) == 5
+    assert time.monotonic() - started < 10
+    assert mp.active_children() == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_discard_parse_executor_keeps_other_children(fake_engine):
+    ctx = mp.get_context("fork")
+    other = ctx.Process(target=time.sleep, args=(30,))
+    other.start()
+    try:
+        executor = desktop_engine._get_parse_executor(2)
+        assert executor.submit(os.getpid).result() != os.getpid()
+        pool_processes = list(executor._processes.values())
+
+        desktop_engine._discard_parse_executor()
+        for process in pool_processes:
+            process.join(10)
+            assert not process.is_alive()
+        assert desktop_engine._parse_executor is None
+        assert other.is_alive()
+    finally:
+        other.terminate()
+        other.join()
+
+
+def test_resolve_input_paths_suffixes(tmp_path, monkeypatch):
+    sniffed = []
+
+    def fake_guess_suffix(path):
+        sniffed.append(os.path.basename(path))
+        return {"scan.tif": "tiff", "noext": "pdf"}.get(os.path.basename(path), "txt")
+
+    monkeypatch.setattr(desktop_engine, "_guess_suffix_by_path", fake_guess_suffix)
+    for name in ["a.pdf", "B.PDF", "photo.Jpg", "scan.tif", "noext", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"x")
+    (tmp_path / "sub.pdf").mkdir()
+
+    resolved = _resolve_input_paths(tmp_path)
+    assert sorted(path.name for path, _ in resolved) == [
+        "B.PDF",
+        "a.pdf",
+        "noext",
+        "photo.Jpg",
+        "scan.tif",
+    ]
+    # Listed extensions are accepted without content sniffing.
+    assert sorted(sniffed) == ["noext", "notes.txt", "scan.tif"]
+
+
+def test_resolve_input_paths_invalid(tmp_path, monkeypatch):
+    monkeypatch.setattr(desktop_engine, "_guess_suffix_by_path", lambda path: "txt")
+    with pytest.raises(InvalidInputError):
+        _resolve_input_paths(tmp_path / "missing.pdf")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    with pytest.raises(InvalidInputError):
+        _resolve_input_paths(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"timeout_ms": 10000}, {"timeout_ms": 10000, "workers": 2}],
+)
+def test_run_engine_skips_misnamed_directory_entries(tmp_path, fake_engine, options):
+    if options and sys.platform == "win32":
+        pytest.skip("needs fork")
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    (input_dir / "good.pdf").write_bytes(b"%PDF-1.4")
+    (input_dir / "notes.pdf").write_bytes(b"<html></html>")
+    output_dir = tmp_path / "out"
+
+    assert _run(input_dir, output_dir, **options) == 0
+    manifest = _read_manifest(output_dir)
+    assert manifest["status"] == "succeeded"
+    assert [os.path.basename(path) for path in manifest["artifacts"]["markdown"]] == [
+        "good.md"
+    ]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"timeout_ms": 10000}, {"timeout_ms": 10000, "workers": 2}],
+)
+def test_run_engine_rejects_directory_without_readable_inputs(
+    tmp_path, fake_engine, options
+):
+    if options and sys.platform == "win32":
+        pytest.skip("needs fork")
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    (input_dir / "notes.pdf").write_bytes(b"<html></html>")
+    (input_dir / "page.png").write_bytes(b"<html></html>")
+    output_dir = tmp_path / "out"
+
+    assert _run(input_dir, output_dir, **options) == 2
+    assert _read_manifest(output_dir)["errorCode"] == "E_INVALID_INPUT"
+
+
+def test_run_engine_single_unreadable_file_fails(tmp_path, fake_engine):
+    input_path = tmp_path / "notes.pdf"
+    input_path.write_bytes(b"<html></html>")
+    output_dir = tmp_path / "out"
+
+    assert _run(input_path, output_dir) == 1
+    assert _read_manifest(output_dir)["errorCode"] == "E_ENGINE_FAILED"
+
+
+def _silent_worker(*args):
+    args[-1].close()
+
+
+def _crashing_worker(*_):
+    os._exit(3)
+
+
+def _failing_do_parse(**_):
+    raise RuntimeError("engine failed")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+@pytest.mark.parametrize("worker", [_silent_worker, _crashing_worker])
+def test_run_engine_worker_without_result(tmp_path, fake_engine, monkeypatch, worker):
+    monkeypatch.setattr(desktop_engine, "_parse_worker", worker)
+    input_path = tmp_path / "doc.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    output_dir = tmp_path / "out"
+
+    assert _run(input_path, output_dir, timeout_ms=10000) == 1
+    assert _read_manifest(output_dir)["errorCode"] == "E_ENGINE_FAILED"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_run_engine_worker_reports_failure(tmp_path, fake_engine, monkeypatch):
+    monkeypatch.setattr(sys.modules["mineru.cli.common"], "do_parse", _failing_do_parse)
+    input_path = tmp_path / "doc.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    output_dir = tmp_path / "out"
+
+    assert _run(input_path, output_dir, timeout_ms=10000) == 1
+    manifest = _read_manifest(output_dir)
+    assert manifest["status"] == "failed"
+    assert manifest["errorCode"] == "E_ENGINE_FAILED"
+
+
+def test_write_result_manifest_creates_output_dir(tmp_path):
+    output_dir = tmp_path / "a" / "b"
+    manifest = {"status": "failed", "outputDir": "输出"}
+
+    assert _write_result_manifest(output_dir, manifest)
+    assert _read_manifest(output_dir) == manifest
+    assert _write_result_manifest(output_dir, {"status": "succeeded"})
+    assert _read_manifest(output_dir) == {"status": "succeeded"}
+
+
+def test_write_result_manifest_unwritable(tmp_path):
+    output_file = tmp_path / "out"
+    output_file.write_text("x", encoding="utf-8")
+    assert not _write_result_manifest(output_file, {"status": "failed"})
+
+
+def test_run_engine_writes_manifest_for_rejected_input(tmp_path):
+    output_dir = tmp_path / "missing" / "out"
+
+    assert _run(tmp_path / "missing.pdf", output_dir) == 2
+    manifest = _read_manifest(output_dir)
+    assert manifest["status"] == "failed"
+    assert manifest["errorCode"] == "E_INVALID_INPUT"
+
+
+@pytest.mark.parametrize("index_artifacts", [True, False])
+def test_run_engine_artifacts_indexed(tmp_path, fake_engine, index_artifacts):
+    input_path = tmp_path / "doc.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    output_dir = tmp_path / "out"
+
+    assert _run(input_path, output_dir, index_artifacts=index_artifacts) == 0
+    assert (output_dir / "doc" / "auto" / "doc.md").is_file()
+    manifest = _read_manifest(output_dir)
+    if index_artifacts:
+        assert "artifactsIndexed" not in manifest
+        assert manifest["artifacts"]["markdown"] == [
+            str(output_dir / "doc" / "auto" / "doc.md")
+        ]
+    else:
+        assert manifest["artifactsIndexed"] is False
+        assert all(paths == [] for paths in manifest["artifacts"].values())
+
+
+def _cancel_parse(**_):
+    raise KeyboardInterrupt
+
+
+def _read_events(capsysbinary):
+    return [json.loads(line) for line in capsysbinary.readouterr().out.splitlines()]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_run_engine_timeout_terminal_event(
+    tmp_path, fake_engine, monkeypatch, capsysbinary
+):
+    monkeypatch.setattr(sys.modules["mineru.cli.common"], "do_parse", _slow_do_parse)
+    input_path = tmp_path / "doc.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    output_dir = tmp_path / "out"
+
+    assert _run(input_path, output_dir, timeout_ms=500, jsonl=True) == 5
+    events = _read_events(capsysbinary)
+    assert [event["type"] for event in events] == [
+        "job.started",
+        "job.progress",
+        "job.failed",
+    ]
+    terminal = events[-1]
+    assert terminal["stage"] == "failed"
+    assert terminal["progress"] == 100
+    assert terminal["message"] == "Engine failed"
+    assert terminal["errorCode"] == "E_TIMEOUT"
+    assert terminal["payload"] == {"resultPath": str(output_dir / "result.json")}
+    assert _read_manifest(output_dir)["status"] == "timeout"
+
+
+@pytest.mark.parametrize(
+    ("do_parse", "exit_code", "expected"),
+    [
+        (_fake_do_parse, 0, ("job.succeeded", "completed", "Completed", None)),
+        (_cancel_parse, 4, ("job.cancelled", "cancelled", "Cancelled", "E_CANCELLED")),
+        (
+            _failing_do_parse,
+            1,
+            ("job.failed", "failed", "Engine failed", "E_ENGINE_FAILED"),
+        ),
+    ],
+)
+def test_run_engine_terminal_event(
+    tmp_path, fake_engine, monkeypatch, capsysbinary, do_parse, exit_code, expected
+):
+    monkeypatch.setattr(sys.modules["mineru.cli.common"], "do_parse", do_parse)
+    input_path = tmp_path / "doc.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    output_dir = tmp_path / "out"
+
+    assert _run(input_path, output_dir, jsonl=True) == exit_code
+    terminal = _read_events(capsysbinary)[-1]
+    assert (
+        terminal["type"],
+        terminal["stage"],
+        terminal["message"],
+        terminal["errorCode"],
+    ) == expected
+    assert terminal["payload"] == {"resultPath": str(output_dir / "result.json")}
+
+
+def test_run_engine_terminal_event_without_manifest(
+    tmp_path, fake_engine, monkeypatch, capsysbinary
+):
+    monkeypatch.setattr(desktop_engine, "_write_result_manifest", lambda *_: False)
+    input_path = tmp_path / "doc.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+
+    assert _run(input_path, tmp_path / "out", jsonl=True) == 3
+    terminal = _read_events(capsysbinary)[-1]
+    assert terminal["type"] == "job.failed"
+    assert terminal["errorCode"] == "E_OUTPUT_UNWRITABLE"
+    assert terminal["payload"] == {"resultPath": None}